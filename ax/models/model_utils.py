@@ -531,12 +531,12 @@ def get_observed(
         used_outcomes = used_outcomes.union(
             np.where(as_array(outcome_constraints)[0] != 0)[1]
         )
-    outcome_list = list(used_outcomes)
-    X_obs_set = {tuple(float(x_i) for x_i in x) for x in Xs[outcome_list[0]]}
-    for _, idx in enumerate(outcome_list, start=1):
-        X_obs_set = X_obs_set.intersection(
-            {tuple(float(x_i) for x_i in x) for x in Xs[idx]}
-        )
+    # Outcomes often share the same feature matrix, in which case its points
+    # only need to be collected once.
+    unique_Xs = list({id(Xs[idx]): Xs[idx] for idx in used_outcomes}.values())
+    X_obs_set = {tuple(float(x_i) for x_i in x) for x in unique_Xs[0]}
+    for X in unique_Xs[1:]:
+        X_obs_set = X_obs_set.intersection({tuple(float(x_i) for x_i in x) for x in X})
     if isinstance(Xs[0], np.ndarray):
         # pyre-fixme[7]: This function only returns a Numpy array when Xs
         # contains all Numpy arrays, but Pyre doesn't understand
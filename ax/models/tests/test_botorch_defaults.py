@@ -16,6 +16,7 @@ from ax.models.torch.botorch_defaults import (
     _get_acquisition_func,
     _get_customized_covar_module,
     _get_model,
+    batched_torch_optimizer,
     get_and_fit_model,
     get_warping_transform,
     NO_OBSERVED_POINTS_MESSAGE,
@@ -35,6 +36,7 @@ from botorch.acquisition.monte_carlo import (
 from botorch.acquisition.objective import ConstrainedMCObjective
 from botorch.acquisition.penalized import L1PenaltyObjective, PenalizedMCObjective
 from botorch.exceptions.errors import UnsupportedError
+from botorch.generation.gen import gen_candidates_torch
 from botorch.models.gp_regression import SingleTaskGP
 from botorch.models.gp_regression_fidelity import SingleTaskMultiFidelityGP
 from botorch.models.multitask import MultiTaskGP
@@ -578,3 +580,46 @@ class BotorchDefaultsTest(TestCase):
         self.assertIsInstance(warp_tf, Warp)
         self.assertEqual(warp_tf.indices.tolist(), list(range(4)))
         self.assertEqual(warp_tf.batch_shape, torch.Size([2]))
+
+    def test_batched_torch_optimizer(self) -> None:
+        acqf = Mock()
+        bounds = torch.tensor([[0.0, 0.0], [1.0, 1.0]])
+        X = torch.rand(2, 2)
+        acqf_value = torch.rand(2)
+        with mock.patch(
+            "ax.models.torch.botorch_defaults.optimize_acqf",
+            return_value=(X, acqf_value),
+        ) as mock_optimize_acqf:
+            candidates, expected_acquisition_value = batched_torch_optimizer(
+                acq_function=acqf,
+                bounds=bounds,
+                n=2,
+                fixed_features={0: 0.5},
+                num_restarts=8,
+                options={"maxiter": 10},
+            )
+        self.assertIs(candidates, X)
+        self.assertIs(expected_acquisition_value, acqf_value)
+        kwargs = mock_optimize_acqf.call_args.kwargs
+        self.assertIs(kwargs["gen_candidates"], gen_candidates_torch)
+        # all restarts are optimized in a single batch
+        self.assertEqual(kwargs["num_restarts"], 8)
+        self.assertEqual(kwargs["raw_samples"], 400)
+        self.assertEqual(
+            kwargs["options"],
+            {"batch_limit": 8, "init_batch_limit": 32, "maxiter": 10},
+        )
+        self.assertEqual(kwargs["fixed_features"], {0: 0.5})
+        self.assertTrue(kwargs["sequential"])
+
+        with self.assertRaisesRegex(
+            UnsupportedError, "does not support parameter constraints"
+        ):
+            batched_torch_optimizer(
+                acq_function=acqf,
+                bounds=bounds,
+                n=1,
+                inequality_constraints=[
+                    (torch.tensor([0, 1]), torch.tensor([1.0, 1.0]), 1.0)
+                ],
+            )
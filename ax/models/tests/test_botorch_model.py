@@ -21,17 +21,22 @@ from ax.models.torch.botorch import (
     get_rounding_func,
 )
 from ax.models.torch.botorch_defaults import (
+    batched_torch_optimizer,
     get_and_fit_model,
     get_chebyshev_scalarization,
 )
-from ax.models.torch.utils import sample_simplex
+from ax.models.torch.utils import normalize_indices, predict_from_model, sample_simplex
 from ax.models.torch_base import TorchOptConfig
 from ax.utils.common.testutils import TestCase
 from ax.utils.testing.mock import mock_botorch_optimize
 from ax.utils.testing.torch_stubs import get_torch_test_data
+from botorch.acquisition.acquisition import AcquisitionFunction
 from botorch.acquisition.utils import get_infeasible_cost
+from botorch.exceptions.errors import UnsupportedError
 from botorch.fit import fit_gpytorch_mll
-from botorch.models import ModelListGP, SingleTaskGP
+from botorch.models import ModelList, ModelListGP, SingleTaskGP
+from botorch.models.fully_bayesian import SaasFullyBayesianSingleTaskGP
+from botorch.models.model import Model
 from botorch.models.transforms.input import Warp
 from botorch.utils.datasets import SupervisedDataset
 from botorch.utils.objective import get_objective_weights_transform
@@ -259,6 +264,7 @@ class BotorchModelTest(TestCase):
                 # Check attributes
                 self.assertTrue(torch.equal(model.Xs[0], Xs1[0]))
                 self.assertTrue(torch.equal(model.Xs[1], Xs2_diff[0]))
+                self.assertIsNot(model.Xs[0], model.Xs[1])
                 self.assertEqual(model.dtype, Xs1[0].dtype)
                 self.assertEqual(model.device, Xs1[0].device)
                 self.assertIsInstance(model.model, ModelListGP)
@@ -334,6 +340,8 @@ class BotorchModelTest(TestCase):
             # Check attributes
             self.assertTrue(torch.equal(model.Xs[0], Xs1[0]))
             self.assertTrue(torch.equal(model.Xs[1], Xs2[0]))
+            # outcomes with the same training inputs share a single tensor
+            self.assertIs(model.Xs[0], model.Xs[1])
             self.assertEqual(model.dtype, Xs1[0].dtype)
             self.assertEqual(model.device, Xs1[0].device)
             if use_input_warping:
@@ -445,6 +453,10 @@ class BotorchModelTest(TestCase):
             self.assertTrue(
                 torch.equal(gen_results.weights, torch.ones(n, dtype=dtype))
             )
+            expected_acquisition_value = gen_results.gen_metadata[
+                "expected_acquisition_value"
+            ]
+            self.assertEqual(expected_acquisition_value, acqfv_dummy.tolist())
             self.assertEqual(
                 mock_optimize_acqf.call_args.kwargs["options"]["init_batch_limit"], 32
             )
@@ -512,6 +524,31 @@ class BotorchModelTest(TestCase):
             X_temp = torch.rand(1, 2, 3, 4)
             self.assertTrue(torch.equal(X_temp, dummy_rounding(X_temp)))
 
+            # by default, rounding funcs are applied to each point separately
+            def round_third_feature(x: torch.Tensor) -> torch.Tensor:
+                x = x.clone()
+                x[2] = x[2].round()
+                return x
+
+            single_point_mock = mock.Mock(wraps=round_third_feature)
+            single_point_rounding = none_throws(get_rounding_func(single_point_mock))
+            expected_X_round = X_temp.clone()
+            expected_X_round[..., 2] = expected_X_round[..., 2].round()
+            self.assertTrue(
+                torch.equal(single_point_rounding(X_temp), expected_X_round)
+            )
+            self.assertEqual(single_point_mock.call_count, 6)
+            self.assertEqual(single_point_mock.call_args.args[0].shape, (4,))
+            # batched rounding funcs are called once on all points, and may
+            # return non-contiguous tensors
+            batched_mock = mock.Mock(side_effect=lambda X: X.t().round().t())
+            batched_rounding = none_throws(
+                get_rounding_func(rounding_func=batched_mock, batched=True)
+            )
+            self.assertTrue(torch.equal(batched_rounding(X_temp), torch.round(X_temp)))
+            self.assertEqual(batched_mock.call_count, 1)
+            self.assertEqual(batched_mock.call_args.args[0].shape, (6, 4))
+
             # Check best point selection
             xbest = model.best_point(
                 search_space_digest=search_space_digest,
@@ -562,6 +599,22 @@ class BotorchModelTest(TestCase):
             self.assertEqual(mean.shape, torch.Size([2, 2]))
             self.assertEqual(variance.shape, torch.Size([2, 2, 2]))
 
+            # the copied state dict keeps the metadata used by `load_state_dict`
+            with mock.patch.object(
+                model, "model_constructor", wraps=model.model_constructor
+            ) as mock_model_constructor:
+                model.cross_validate(
+                    datasets=combined_datasets,
+                    X_test=torch.tensor([[1.2, 3.2, 4.2]], **tkwargs),
+                )
+            state_dict = mock_model_constructor.call_args.kwargs["state_dict"]
+            model_state_dict = model.model.state_dict()
+            # pyre-fixme[16]: `OrderedDict` has no attribute `_metadata`.
+            self.assertEqual(state_dict._metadata, model_state_dict._metadata)
+            self.assertEqual(state_dict.keys(), model_state_dict.keys())
+            for k, v in model_state_dict.items():
+                self.assertTrue(torch.equal(state_dict[k], v))
+
             # Test cross-validation with refit_on_cv
             model.refit_on_cv = True
             mean, variance = model.cross_validate(
@@ -752,6 +805,397 @@ class BotorchModelTest(TestCase):
                 torch_opt_config=TorchOptConfig(objective_weights),
             )
 
+    def test_BotorchModel_device(self) -> None:
+        (
+            Xs1,
+            Ys1,
+            Yvars1,
+            bounds,
+            tfs,
+            feature_names,
+            metric_names,
+        ) = get_torch_test_data(dtype=torch.float, cuda=False, constant_noise=True)
+        datasets = [
+            SupervisedDataset(
+                X=Xs1[0],
+                Y=Ys1[0],
+                Yvar=Yvars1[0],
+                feature_names=feature_names,
+                outcome_names=metric_names,
+            )
+        ]
+        search_space_digest = SearchSpaceDigest(
+            feature_names=feature_names, bounds=bounds, task_features=tfs
+        )
+        cpu = torch.device("cpu")
+        # Running out of GPU memory while fitting falls back to the CPU.
+        model_constructor = mock.Mock(
+            side_effect=[torch.cuda.OutOfMemoryError("OOM"), mock.Mock()]
+        )
+        model = BotorchModel(
+            model_constructor=model_constructor, device=torch.device("cuda")
+        )
+        # Only record the device so that this runs on machines without a GPU.
+        with (
+            mock.patch.object(
+                model,
+                "_move_to_device",
+                side_effect=lambda device: setattr(model, "device", device),
+            ) as mock_move,
+            mock.patch("torch.cuda.empty_cache") as mock_empty_cache,
+        ):
+            model.fit(datasets=datasets, search_space_digest=search_space_digest)
+        self.assertEqual(model_constructor.call_count, 2)
+        mock_empty_cache.assert_called_once()
+        self.assertEqual(
+            [c.kwargs["device"] for c in mock_move.call_args_list],
+            [torch.device("cuda"), cpu],
+        )
+        self.assertEqual(model.device, cpu)
+
+        # Running out of GPU memory while generating falls back to the CPU.
+        model = BotorchModel(device=cpu)
+        with mock.patch(FIT_MODEL_MO_PATH):
+            model.fit(datasets=datasets, search_space_digest=search_space_digest)
+        self.assertEqual(model.device, cpu)
+        self.assertTrue(all(X.device == cpu for X in model.Xs))
+        gen_results = mock.Mock()
+        model.device = torch.device("cuda")
+        with (
+            mock.patch.object(
+                model,
+                "_gen",
+                side_effect=[torch.cuda.OutOfMemoryError("OOM"), gen_results],
+            ) as mock_gen,
+            mock.patch("torch.cuda.empty_cache") as mock_empty_cache,
+        ):
+            result = model.gen(
+                n=1,
+                search_space_digest=search_space_digest,
+                torch_opt_config=TorchOptConfig(objective_weights=torch.ones(1)),
+            )
+        self.assertIs(result, gen_results)
+        self.assertEqual(mock_gen.call_count, 2)
+        mock_empty_cache.assert_called_once()
+        self.assertEqual(model.device, cpu)
+
+        # Errors are re-raised if the model is not on a GPU.
+        with (
+            mock.patch.object(
+                model, "_gen", side_effect=torch.cuda.OutOfMemoryError("OOM")
+            ),
+            self.assertRaises(torch.cuda.OutOfMemoryError),
+        ):
+            model.gen(
+                n=1,
+                search_space_digest=search_space_digest,
+                torch_opt_config=TorchOptConfig(objective_weights=torch.ones(1)),
+            )
+
+        # With aggressive_gc, memory is released after generating candidates.
+        for device, aggressive_gc in product(
+            (cpu, torch.device("cuda")), (False, True)
+        ):
+            model.device = device
+            model.aggressive_gc = aggressive_gc
+            with (
+                mock.patch.object(model, "_gen", return_value=gen_results),
+                mock.patch("gc.collect") as mock_collect,
+                mock.patch("torch.cuda.empty_cache") as mock_empty_cache,
+            ):
+                model.gen(
+                    n=1,
+                    search_space_digest=search_space_digest,
+                    torch_opt_config=TorchOptConfig(objective_weights=torch.ones(1)),
+                )
+            self.assertEqual(mock_collect.called, aggressive_gc)
+            self.assertEqual(
+                mock_empty_cache.called, aggressive_gc and device.type == "cuda"
+            )
+
+    def test_BotorchModel_use_jit(self) -> None:
+        Xs1, Ys1, Yvars1, bounds, tfs, feature_names, metric_names = (
+            get_torch_test_data(dtype=torch.double, cuda=False, constant_noise=True)
+        )
+        datasets = [
+            SupervisedDataset(
+                X=Xs1[0],
+                Y=Ys1[0],
+                Yvar=Yvars1[0],
+                feature_names=feature_names,
+                outcome_names=metric_names,
+            )
+        ]
+        search_space_digest = SearchSpaceDigest(
+            feature_names=feature_names, bounds=bounds, task_features=tfs
+        )
+        model = BotorchModel(use_jit=True)
+        with mock.patch(FIT_MODEL_MO_PATH):
+            model.fit(datasets=datasets, search_space_digest=search_space_digest)
+        X = torch.rand(4, 3, dtype=torch.double)
+        expected_mean, expected_cov = predict_from_model(model=model.model, X=X)
+        with mock.patch("torch.jit.trace", wraps=torch.jit.trace) as mock_trace:
+            for _ in range(2):
+                f_mean, f_cov = model.predict(X)
+                self.assertTrue(torch.allclose(f_mean, expected_mean))
+                self.assertTrue(torch.allclose(f_cov, expected_cov))
+            # the traced predictor is reused for inputs of the same shape
+            mock_trace.assert_called_once()
+            f_mean, _ = model.predict(X[:2])
+            self.assertEqual(f_mean.shape, torch.Size([2, 1]))
+            self.assertEqual(mock_trace.call_count, 2)
+            # refitting the model discards the traced predictors
+            with mock.patch(FIT_MODEL_MO_PATH):
+                model.fit(datasets=datasets, search_space_digest=search_space_digest)
+            model.predict(X)
+            self.assertEqual(mock_trace.call_count, 3)
+            # only the most recently used predictors are kept
+            with mock.patch(f"{BotorchModel.__module__}.MAX_TRACED_PREDICTORS", 2):
+                model.predict(X[:2])
+                model.predict(X)
+                model.predict(X[:3])
+                self.assertEqual(mock_trace.call_count, 5)
+                self.assertEqual(
+                    [key[0] for key in model._traced_predictors],
+                    [(4, 3), (3, 3)],
+                )
+                # the evicted predictor is traced again
+                model.predict(X[:2])
+                self.assertEqual(mock_trace.call_count, 6)
+
+        # tracing a predictor with value-dependent control flow is not silent
+        def value_dependent_predictor(
+            model: Model, X: torch.Tensor, use_posterior_predictive: bool = False
+        ) -> tuple[torch.Tensor, torch.Tensor]:
+            mean, cov = predict_from_model(
+                model=model, X=X, use_posterior_predictive=use_posterior_predictive
+            )
+            return (mean if bool((mean > 0).all()) else mean.clamp_min(0.0)), cov
+
+        model.model_predictor = value_dependent_predictor
+        with self.assertWarns(torch.jit.TracerWarning):
+            model.predict(X[:1])
+
+    def test_BotorchModel_use_torch_compile(self) -> None:
+        with self.assertRaisesRegex(ValueError, "cannot both be True"):
+            BotorchModel(use_jit=True, use_torch_compile=True)
+        Xs1, Ys1, Yvars1, bounds, tfs, feature_names, metric_names = (
+            get_torch_test_data(dtype=torch.double, cuda=False, constant_noise=True)
+        )
+        model = BotorchModel(use_torch_compile=True)
+        compiled_posterior = mock.Mock()
+        with (
+            mock.patch(FIT_MODEL_MO_PATH),
+            mock.patch(
+                "torch.compile", return_value=compiled_posterior
+            ) as mock_compile,
+        ):
+            model.fit(
+                datasets=[
+                    SupervisedDataset(
+                        X=Xs1[0],
+                        Y=Ys1[0],
+                        Yvar=Yvars1[0],
+                        feature_names=feature_names,
+                        outcome_names=metric_names,
+                    )
+                ],
+                search_space_digest=SearchSpaceDigest(
+                    feature_names=feature_names, bounds=bounds, task_features=tfs
+                ),
+            )
+        mock_compile.assert_called_once()
+        self.assertEqual(mock_compile.call_args.args[0], model.model.posterior)
+        self.assertEqual(mock_compile.call_args.kwargs, {"dynamic": True})
+        # the compiled posterior is used during `predict` only
+        compiled_posterior.side_effect = lambda X, **kwargs: (
+            type(model.model).posterior(model.model, X, **kwargs)
+        )
+        X = torch.rand(2, 3, dtype=torch.double)
+        f_mean, f_cov = model.predict(X)
+        compiled_posterior.assert_called_once()
+        self.assertEqual(f_mean.shape, torch.Size([2, 1]))
+        self.assertEqual(f_cov.shape, torch.Size([2, 1, 1]))
+        self.assertNotIn("posterior", vars(model.model))
+        # replacing the model discards the compiled posterior
+        model.model = model.model
+        self.assertIsNone(model._compiled_posterior)
+        # predictions with the compiled posterior match the eager ones on the CPU
+        model = BotorchModel(use_torch_compile=True)
+        with mock.patch(FIT_MODEL_MO_PATH):
+            model.fit(
+                datasets=[
+                    SupervisedDataset(
+                        X=Xs1[0],
+                        Y=Ys1[0],
+                        Yvar=Yvars1[0],
+                        feature_names=feature_names,
+                        outcome_names=metric_names,
+                    )
+                ],
+                search_space_digest=SearchSpaceDigest(
+                    feature_names=feature_names, bounds=bounds, task_features=tfs
+                ),
+            )
+        self.assertIsNotNone(model._compiled_posterior)
+        expected_mean, expected_cov = predict_from_model(model=model.model, X=X)
+        f_mean, f_cov = model.predict(X)
+        self.assertTrue(torch.allclose(f_mean, expected_mean))
+        self.assertTrue(torch.allclose(f_cov, expected_cov))
+
+    def test_BotorchModel_sobol_dimension_retry(self) -> None:
+        Xs1, Ys1, Yvars1, bounds, tfs, feature_names, metric_names = (
+            get_torch_test_data(dtype=torch.float, cuda=False, constant_noise=True)
+        )
+        X_dummy = torch.rand(1, 3)
+        acqf_optimizer = mock.Mock(
+            side_effect=[
+                UnsupportedError("SobolQMCSampler only supports dimensions ..."),
+                (X_dummy, torch.tensor([1.0])),
+            ]
+        )
+        acqf_constructor = mock.Mock(return_value=mock.Mock(spec=AcquisitionFunction))
+        model = BotorchModel(
+            acqf_constructor=acqf_constructor, acqf_optimizer=acqf_optimizer
+        )
+        search_space_digest = SearchSpaceDigest(
+            feature_names=feature_names, bounds=bounds, task_features=tfs
+        )
+        with mock.patch(FIT_MODEL_MO_PATH):
+            model.fit(
+                datasets=[
+                    SupervisedDataset(
+                        X=Xs1[0],
+                        Y=Ys1[0],
+                        Yvar=Yvars1[0],
+                        feature_names=feature_names,
+                        outcome_names=metric_names,
+                    )
+                ],
+                search_space_digest=search_space_digest,
+            )
+        with (
+            mock.patch(
+                f"{BotorchModel.__module__}._to_inequality_constraints",
+                return_value=None,
+            ) as mock_to_inequality_constraints,
+            mock.patch(f"{BotorchModel.__module__}.subset_model") as mock_subset_model,
+            mock.patch(
+                f"{BotorchModel.__module__}._torch_opt_config_to_device"
+            ) as mock_config_to_device,
+        ):
+            gen_results = model.gen(
+                n=1,
+                search_space_digest=search_space_digest,
+                torch_opt_config=TorchOptConfig(objective_weights=torch.ones(1)),
+            )
+        # the model isn't subset since the objective uses all outcomes
+        mock_subset_model.assert_not_called()
+        # the config is left alone unless a device was requested
+        mock_config_to_device.assert_not_called()
+        self.assertIs(acqf_constructor.call_args.kwargs["model"], model.model)
+        self.assertTrue(torch.equal(gen_results.points, X_dummy))
+        # the acquisition function is rebuilt without QMC sampling ...
+        self.assertEqual(acqf_constructor.call_count, 2)
+        self.assertNotIn("qmc", acqf_constructor.call_args_list[0].kwargs)
+        self.assertFalse(acqf_constructor.call_args_list[1].kwargs["qmc"])
+        self.assertEqual(acqf_optimizer.call_count, 2)
+        # ... but the constraints are only computed once
+        mock_to_inequality_constraints.assert_called_once()
+
+    def test_BotorchModel_batched_torch_optimizer(self) -> None:
+        Xs1, Ys1, Yvars1, bounds, tfs, feature_names, metric_names = (
+            get_torch_test_data(dtype=torch.double, cuda=False, constant_noise=True)
+        )
+        search_space_digest = SearchSpaceDigest(
+            feature_names=feature_names, bounds=bounds, task_features=tfs
+        )
+        model = BotorchModel(acqf_optimizer=batched_torch_optimizer)
+        with mock.patch(FIT_MODEL_MO_PATH):
+            model.fit(
+                datasets=[
+                    SupervisedDataset(
+                        X=Xs1[0],
+                        Y=Ys1[0],
+                        Yvar=Yvars1[0],
+                        feature_names=feature_names,
+                        outcome_names=metric_names,
+                    )
+                ],
+                search_space_digest=search_space_digest,
+            )
+        gen_results = model.gen(
+            n=2,
+            search_space_digest=search_space_digest,
+            torch_opt_config=TorchOptConfig(
+                objective_weights=torch.ones(1, dtype=torch.double),
+                model_gen_options={
+                    "optimizer_kwargs": {
+                        "num_restarts": 2,
+                        "raw_samples": 8,
+                        "options": {"maxiter": 3},
+                    }
+                },
+            ),
+        )
+        self.assertEqual(gen_results.points.shape, torch.Size([2, 3]))
+        bounds_ = torch.tensor(bounds, dtype=torch.double).t()
+        self.assertTrue((gen_results.points >= bounds_[0]).all())
+        self.assertTrue((gen_results.points <= bounds_[1]).all())
+        self.assertEqual(len(gen_results.gen_metadata["expected_acquisition_value"]), 2)
+
+    def test_bounds_tensor_cache(self) -> None:
+        model = BotorchModel()
+        model.dtype = torch.double
+        model.device = torch.device("cpu")
+        bounds = [(0.0, 1.0), (-1.0, 2.0)]
+        bounds_ = model._get_bounds_tensor(bounds=bounds)
+        self.assertTrue(
+            torch.equal(
+                bounds_, torch.tensor([[0.0, -1.0], [1.0, 2.0]], dtype=torch.double)
+            )
+        )
+        # the tensor is reused for equal bounds, dtype, and device
+        self.assertIs(model._get_bounds_tensor(bounds=list(bounds)), bounds_)
+        # and rebuilt if any of them change
+        new_bounds_ = model._get_bounds_tensor(bounds=[(0.0, 1.0), (-1.0, 3.0)])
+        self.assertIsNot(new_bounds_, bounds_)
+        self.assertEqual(new_bounds_[1, 1].item(), 3.0)
+        model.dtype = torch.float
+        self.assertEqual(model._get_bounds_tensor(bounds=bounds).dtype, torch.float)
+        # bounds given as an array of matching dtype are not copied
+        bounds_array = np.array(bounds, dtype=np.float32)
+        # pyre-fixme[6]: For 1st param expected `List[Tuple[Union[float, int],
+        #  Union[float, int]]]` but got `ndarray`.
+        bounds_ = model._get_bounds_tensor(bounds=bounds_array)
+        self.assertEqual(bounds_.shape, torch.Size([2, 2]))
+        self.assertEqual(bounds_.data_ptr(), bounds_array.ctypes.data)
+
+    def test_normalize_feature_indices_cache(self) -> None:
+        model = BotorchModel()
+        search_space_digest = SearchSpaceDigest(
+            feature_names=["x0", "x1", "x2"],
+            bounds=[(0.0, 1.0)] * 3,
+            task_features=[-1],
+            fidelity_features=[1],
+        )
+        with mock.patch(
+            f"{BotorchModel.__module__}.normalize_indices", wraps=normalize_indices
+        ) as mock_normalize_indices:
+            for _ in range(2):
+                task_features, fidelity_features = model._normalize_feature_indices(
+                    search_space_digest=search_space_digest, d=3
+                )
+                self.assertEqual(task_features, [2])
+                self.assertEqual(fidelity_features, [1])
+            # the normalized indices are reused for the same features
+            self.assertEqual(mock_normalize_indices.call_count, 2)
+            task_features, _ = model._normalize_feature_indices(
+                search_space_digest=search_space_digest, d=4
+            )
+            self.assertEqual(task_features, [3])
+            self.assertEqual(mock_normalize_indices.call_count, 4)
+
     def test_botorchmodel_raises_when_no_data(self) -> None:
         _, _, _, bounds, tfs, feature_names, metric_names = get_torch_test_data(
             dtype=torch.float, cuda=False, constant_noise=True
@@ -780,6 +1224,54 @@ class BotorchModelTest(TestCase):
         importances = get_feature_importances_from_botorch_model(simple_gp)
         self.assertTrue(np.allclose(importances, np.array([15 / 23, 5 / 23, 3 / 23])))
         self.assertEqual(importances.shape, (1, 1, 3))
+        # Model list with a batched multi-output model and a single-output model
+        other_gp = SingleTaskGP(train_X=train_X, train_Y=train_Y)
+        # pyre-fixme[16]: `Module` has no attribute `lengthscale`.
+        other_gp.covar_module.lengthscale = torch.tensor([1, 1, 2], **tkwargs)
+        importances = get_feature_importances_from_botorch_model(
+            ModelListGP(simple_gp, other_gp)
+        )
+        self.assertEqual(importances.shape, (2, 1, 3))
+        self.assertTrue(
+            np.allclose(
+                importances,
+                np.array([[[15 / 23, 5 / 23, 3 / 23]], [[0.4, 0.4, 0.2]]]),
+            )
+        )
+        batched_gp = SingleTaskGP(
+            train_X=train_X, train_Y=torch.cat([train_Y, -train_Y], dim=-1)
+        )
+        importances = get_feature_importances_from_botorch_model(
+            ModelListGP(batched_gp, other_gp)
+        )
+        self.assertEqual(importances.shape, (3, 1, 3))
+        self.assertTrue(np.allclose(importances[2], np.array([0.4, 0.4, 0.2])))
+        # Model list of fully Bayesian models, using the median lengthscales
+        saas_models = []
+        for lengthscale in (
+            [[1, 2, 4], [2, 4, 8], [4, 8, 16]],
+            [[1, 1, 2], [3, 3, 6], [5, 5, 10]],
+        ):
+            saas_gp = SaasFullyBayesianSingleTaskGP(train_X=train_X, train_Y=train_Y)
+            saas_gp.load_mcmc_samples(
+                {
+                    "lengthscale": torch.tensor(lengthscale, **tkwargs),
+                    "outputscale": torch.rand(3, **tkwargs),
+                    "mean": torch.randn(3, **tkwargs),
+                    "noise": torch.rand(3, **tkwargs),
+                }
+            )
+            saas_models.append(saas_gp)
+        importances = get_feature_importances_from_botorch_model(
+            ModelList(*saas_models)
+        )
+        self.assertEqual(importances.shape, (2, 1, 3))
+        self.assertTrue(
+            np.allclose(
+                importances,
+                np.array([[[4 / 7, 2 / 7, 1 / 7]], [[0.4, 0.4, 0.2]]]),
+            )
+        )
         # Model with kernel that has no lengthscales
         simple_gp.covar_module = ConstantKernel()
         with self.assertRaisesRegex(
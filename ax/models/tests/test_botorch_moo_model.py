@@ -16,7 +16,7 @@ import botorch.utils.multi_objective.hypervolume as hypervolume
 import numpy as np
 import torch
 from ax.core.search_space import SearchSpaceDigest
-from ax.exceptions.core import AxError
+from ax.exceptions.core import AxError, UnsupportedError
 from ax.models.torch.botorch_defaults import get_qLogNEI
 from ax.models.torch.botorch_moo import MultiObjectiveBotorchModel
 from ax.models.torch.botorch_moo_defaults import (
@@ -113,6 +113,16 @@ class BotorchMOOModelTest(TestCase):
                         dtype=dtype, cuda=True, use_noisy=use_noisy, use_log=True
                     )
 
+    def test_BotorchMOOModel_unsupported_kwargs(self) -> None:
+        for kwargs in (
+            {"device": torch.device("cpu")},
+            {"use_jit": True},
+            {"use_torch_compile": True},
+            {"aggressive_gc": True},
+        ):
+            with self.assertRaisesRegex(UnsupportedError, next(iter(kwargs))):
+                MultiObjectiveBotorchModel(**kwargs)
+
     def test_BotorchMOOModel_with_qnehvi(self) -> None:
         # testing non-log version
         for dtype in (torch.float, torch.double):
@@ -8,12 +8,17 @@
 
 from __future__ import annotations
 
+import dataclasses
+import functools
+import gc
 import warnings
-from collections.abc import Callable
-from copy import deepcopy
+from collections import OrderedDict
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
 from logging import Logger
 from typing import Any, Optional
 
+import gpytorch
 import numpy.typing as npt
 import torch
 from ax.core.search_space import SearchSpaceDigest
@@ -42,6 +47,7 @@ from ax.utils.common.logger import get_logger
 from botorch.acquisition.acquisition import AcquisitionFunction
 from botorch.models import ModelList
 from botorch.models.model import Model
+from botorch.posteriors.posterior import Posterior
 from botorch.utils.datasets import SupervisedDataset
 from botorch.utils.transforms import is_ensemble
 from pyre_extensions import assert_is_instance
@@ -50,6 +56,10 @@ from torch.nn import ModuleList  # @manual
 
 logger: Logger = get_logger(__name__)
 
+# Maximum number of input shapes for which `BotorchModel` keeps a traced predictor
+# when `use_jit=True`.
+MAX_TRACED_PREDICTORS = 8
+
 
 # pyre-fixme[33]: Aliased annotation cannot contain `Any`.
 TModelConstructor = Callable[
@@ -136,6 +146,27 @@ class BotorchModel(TorchModel):
             - sd_prior: A scalar prior over nonnegative numbers, which is used for the
                 default LKJCovariancePrior task_covar_prior.
             - eta: The eta parameter on the default LKJ task_covar_prior.
+        device: An optional device on which to fit the model and optimize the
+            acquisition function. If provided, the training data is moved to this
+            device in `fit`. If a CUDA device runs out of memory during `fit` or
+            `gen`, the model falls back to the CPU. If None, the device of the
+            training data is used.
+        use_jit: If True, `predict` traces `model_predictor` with TorchScript the
+            first time it is called with inputs of a given shape, and reuses the
+            traced predictor for later calls with the same shape. This speeds up
+            repeated predictions, but requires `model_predictor` to be traceable:
+            control flow that depends on the values of the inputs is fixed to the
+            inputs of the first call, which is reported by a `TracerWarning`.
+        use_torch_compile: If True, compile the posterior computation of the
+            fitted model with `torch.compile` and use it in `predict`. Shapes are
+            compiled dynamically to avoid recompiling for inputs of different
+            sizes. Note that the first calls to `predict` after fitting incur a
+            substantial compilation cost, so this only pays off when predicting
+            many times with the same model. Cannot be combined with `use_jit`.
+        aggressive_gc: If True, run the garbage collector after each call to `gen`
+            and, if the model is on a GPU, release the cached GPU memory. This
+            reduces the memory footprint of long loops of `gen` calls at the cost
+            of some runtime per call.
 
 
     Call signatures:
@@ -240,6 +271,15 @@ class BotorchModel(TorchModel):
     Yvars: list[Tensor]
     _model: Model | None
     _search_space_digest: SearchSpaceDigest | None = None
+    _requested_device: torch.device | None = None
+    _bounds_cache: tuple[Any, Tensor] | None = None
+    _normalized_indices_cache: tuple[Any, tuple[list[int], list[int]]] | None = None
+    # Unit weights returned by `gen`, shared across instances.
+    use_jit: bool = False
+    use_torch_compile: bool = False
+    _compiled_posterior: Callable[..., Posterior] | None = None
+    aggressive_gc: bool = False
+    _traced_predictors: OrderedDict[tuple[Any, ...], Callable[[Tensor], Any]]
 
     def __init__(
         self,
@@ -254,6 +294,10 @@ class BotorchModel(TorchModel):
         use_input_warping: bool = False,
         use_loocv_pseudo_likelihood: bool = False,
         prior: dict[str, Any] | None = None,
+        device: torch.device | None = None,
+        use_jit: bool = False,
+        use_torch_compile: bool = False,
+        aggressive_gc: bool = False,
         **kwargs: Any,
     ) -> None:
         warnings.warn(
@@ -285,6 +329,16 @@ class BotorchModel(TorchModel):
         self.Yvars = []
         self.dtype = None
         self.device = None
+        self._requested_device = device
+        self._bounds_cache: tuple[Any, Tensor] | None = None
+        self._normalized_indices_cache = None
+        if use_jit and use_torch_compile:
+            raise ValueError("`use_jit` and `use_torch_compile` cannot both be True.")
+        self.use_jit = use_jit
+        self.use_torch_compile = use_torch_compile
+        self._compiled_posterior = None
+        self.aggressive_gc = aggressive_gc
+        self._traced_predictors = OrderedDict()
         self.task_features: list[int] = []
         self.fidelity_features: list[int] = []
         self.metric_names: list[str] = []
@@ -299,33 +353,62 @@ class BotorchModel(TorchModel):
         if len(datasets) == 0:
             raise DataRequiredError("BotorchModel.fit requires non-empty data sets.")
         self.Xs, self.Ys, self.Yvars = _datasets_to_legacy_inputs(datasets=datasets)
+        if all(X is self.Xs[0] or torch.equal(X, self.Xs[0]) for X in self.Xs[1:]):
+            # All outcomes share the same training inputs. Reference a single
+            # tensor so that consumers of `Xs` (e.g. `get_observed`) only need to
+            # process it once.
+            self.Xs = [self.Xs[0]] * len(self.Xs)
         self.metric_names = sum((ds.outcome_names for ds in datasets), [])
         # Store search space info for later use (e.g. during generation)
         self._search_space_digest = search_space_digest
         self.dtype = self.Xs[0].dtype
         self.device = self.Xs[0].device
-        self.task_features = normalize_indices(
-            search_space_digest.task_features, d=self.Xs[0].size(-1)
-        )
-        self.fidelity_features = normalize_indices(
-            search_space_digest.fidelity_features, d=self.Xs[0].size(-1)
+        if self._requested_device is not None:
+            self._move_to_device(device=self._requested_device)
+        self.task_features, self.fidelity_features = self._normalize_feature_indices(
+            search_space_digest=search_space_digest, d=self.Xs[0].size(-1)
         )
         extra_kwargs = {} if self.prior is None else {"prior": self.prior}
-        self._model = self.model_constructor(  # pyre-ignore [28]
-            Xs=self.Xs,
-            Ys=self.Ys,
-            Yvars=self.Yvars,
-            task_features=self.task_features,
-            fidelity_features=self.fidelity_features,
-            metric_names=self.metric_names,
-            use_input_warping=self.use_input_warping,
-            use_loocv_pseudo_likelihood=self.use_loocv_pseudo_likelihood,
-            **extra_kwargs,
-            **self._kwargs,
-        )
+
+        def construct_model() -> Model:
+            return self.model_constructor(  # pyre-ignore [28]
+                Xs=self.Xs,
+                Ys=self.Ys,
+                Yvars=self.Yvars,
+                task_features=self.task_features,
+                fidelity_features=self.fidelity_features,
+                metric_names=self.metric_names,
+                use_input_warping=self.use_input_warping,
+                use_loocv_pseudo_likelihood=self.use_loocv_pseudo_likelihood,
+                **extra_kwargs,
+                **self._kwargs,
+            )
+
+        try:
+            self._model = construct_model()
+        except torch.cuda.OutOfMemoryError:
+            if self.device.type != "cuda":
+                raise
+            self._fall_back_to_cpu(stage="fitting the model")
+            self._model = construct_model()
+        self._traced_predictors = OrderedDict()
+        self._compiled_posterior = None
+        if self.use_torch_compile and hasattr(torch, "compile"):
+            self._compiled_posterior = torch.compile(
+                self._model.posterior, dynamic=True
+            )
 
     @copy_doc(TorchModel.predict)
     def predict(self, X: Tensor) -> tuple[Tensor, Tensor]:
+        if self._requested_device is not None:
+            X = X.to(device=self.device)
+        if self.use_jit:
+            return self._get_traced_predictor(X=X)(X)
+        if self._compiled_posterior is not None:
+            with _override_posterior(
+                model=self.model, posterior=self._compiled_posterior
+            ):
+                return self.model_predictor(model=self.model, X=X)  # pyre-ignore [28]
         return self.model_predictor(model=self.model, X=X)  # pyre-ignore [28]
 
     @copy_doc(TorchModel.gen)
@@ -335,6 +418,39 @@ class BotorchModel(TorchModel):
         search_space_digest: SearchSpaceDigest,
         torch_opt_config: TorchOptConfig,
     ) -> TorchGenResults:
+        try:
+            gen_results = self._gen(
+                n=n,
+                search_space_digest=search_space_digest,
+                torch_opt_config=torch_opt_config,
+            )
+        except torch.cuda.OutOfMemoryError:
+            if self.device is None or self.device.type != "cuda":
+                raise
+            self._fall_back_to_cpu(stage="generating candidates")
+            gen_results = self._gen(
+                n=n,
+                search_space_digest=search_space_digest,
+                torch_opt_config=torch_opt_config,
+            )
+        if self.aggressive_gc:
+            # The acquisition function and the subset model are no longer
+            # referenced once `_gen` returns, but may be part of reference cycles.
+            gc.collect()
+            if self.device is not None and self.device.type == "cuda":
+                torch.cuda.empty_cache()
+        return gen_results
+
+    def _gen(
+        self,
+        n: int,
+        search_space_digest: SearchSpaceDigest,
+        torch_opt_config: TorchOptConfig,
+    ) -> TorchGenResults:
+        if self._requested_device is not None:
+            torch_opt_config = _torch_opt_config_to_device(
+                torch_opt_config=torch_opt_config, device=self.device
+            )
         options = torch_opt_config.model_gen_options or {}
         acf_options = options.get(Keys.ACQF_KWARGS, {})
         optimizer_options = options.get(Keys.OPTIMIZER_KWARGS, {})
@@ -355,7 +471,10 @@ class BotorchModel(TorchModel):
         )
         model = self.model
         # subset model only to the outcomes we need for the optimization	357
-        if options.get(Keys.SUBSET_MODEL, True):
+        # (if all outcomes are part of the objective, there is nothing to subset)
+        if options.get(Keys.SUBSET_MODEL, True) and not bool(
+            (torch_opt_config.objective_weights != 0).all()
+        ):
             subset_model_results = subset_model(
                 model=model,
                 objective_weights=torch_opt_config.objective_weights,
@@ -368,48 +487,52 @@ class BotorchModel(TorchModel):
             objective_weights = torch_opt_config.objective_weights
             outcome_constraints = torch_opt_config.outcome_constraints
 
-        bounds_ = torch.tensor(
-            search_space_digest.bounds, dtype=self.dtype, device=self.device
-        )
-        bounds_ = bounds_.transpose(0, 1)
+        bounds_ = self._get_bounds_tensor(bounds=search_space_digest.bounds)
 
-        botorch_rounding_func = get_rounding_func(torch_opt_config.rounding_func)
+        botorch_rounding_func = get_rounding_func(
+            rounding_func=torch_opt_config.rounding_func,
+            batched=torch_opt_config.batched_rounding_func,
+        )
 
         from botorch.exceptions.errors import UnsupportedError
 
-        # pyre-fixme[53]: Captured variable `X_observed` is not annotated.
-        # pyre-fixme[53]: Captured variable `X_pending` is not annotated.
-        # pyre-fixme[53]: Captured variable `acf_options` is not annotated.
+        # These don't depend on the acquisition function, so compute them once
+        # rather than on each attempt to construct and optimize it.
+        inequality_constraints = _to_inequality_constraints(
+            linear_constraints=torch_opt_config.linear_constraints
+        )
+
+        # Bind the arguments that are the same for each attempt to construct the
+        # acquisition function, so that a retry only needs to pass `qmc`.
+        acqf_constructor = functools.partial(
+            self.acqf_constructor,
+            model=model,
+            objective_weights=objective_weights,
+            outcome_constraints=outcome_constraints,
+            X_observed=X_observed,
+            X_pending=X_pending,
+            **acf_options,
+        )
+
+        # pyre-fixme[53]: Captured variable `acqf_constructor` is not annotated.
+        def make_acqf(override_qmc: bool = False) -> AcquisitionFunction:
+            add_kwargs = {"qmc": False} if override_qmc else {}
+            acquisition_function = acqf_constructor(**add_kwargs)
+            return assert_is_instance(acquisition_function, AcquisitionFunction)
+
         # pyre-fixme[53]: Captured variable `botorch_rounding_func` is not annotated.
         # pyre-fixme[53]: Captured variable `bounds_` is not annotated.
-        # pyre-fixme[53]: Captured variable `model` is not annotated.
-        # pyre-fixme[53]: Captured variable `objective_weights` is not annotated.
+        # pyre-fixme[53]: Captured variable `inequality_constraints` is not annotated.
         # pyre-fixme[53]: Captured variable `optimizer_options` is not annotated.
-        # pyre-fixme[53]: Captured variable `outcome_constraints` is not annotated.
-        def make_and_optimize_acqf(override_qmc: bool = False) -> tuple[Tensor, Tensor]:
-            add_kwargs = {"qmc": False} if override_qmc else {}
-            acquisition_function = self.acqf_constructor(
-                model=model,
-                objective_weights=objective_weights,
-                outcome_constraints=outcome_constraints,
-                X_observed=X_observed,
-                X_pending=X_pending,
-                **acf_options,
-                **add_kwargs,
-            )
-            acquisition_function = assert_is_instance(
-                acquisition_function, AcquisitionFunction
-            )
+        def optimize_acqf(
+            acquisition_function: AcquisitionFunction,
+        ) -> tuple[Tensor, Tensor]:
             # pyre-ignore: [28]
             candidates, expected_acquisition_value = self.acqf_optimizer(
-                acq_function=assert_is_instance(
-                    acquisition_function, AcquisitionFunction
-                ),
+                acq_function=acquisition_function,
                 bounds=bounds_,
                 n=n,
-                inequality_constraints=_to_inequality_constraints(
-                    linear_constraints=torch_opt_config.linear_constraints
-                ),
+                inequality_constraints=inequality_constraints,
                 fixed_features=torch_opt_config.fixed_features,
                 rounding_func=botorch_rounding_func,
                 **optimizer_options,
@@ -417,12 +540,12 @@ class BotorchModel(TorchModel):
             return candidates, expected_acquisition_value
 
         try:
-            candidates, expected_acquisition_value = make_and_optimize_acqf()
+            candidates, expected_acquisition_value = optimize_acqf(make_acqf())
         except UnsupportedError as e:  # untested
             if "SobolQMCSampler only supports dimensions" in str(e):
                 # dimension too large for Sobol, let's use IID
-                candidates, expected_acquisition_value = make_and_optimize_acqf(
-                    override_qmc=True
+                candidates, expected_acquisition_value = optimize_acqf(
+                    make_acqf(override_qmc=True)
                 )
             else:
                 raise e
@@ -449,10 +572,11 @@ class BotorchModel(TorchModel):
             raise NotImplementedError(
                 "Best observed point is incompatible with MOO problems."
             )
+        fidelity_features = set(search_space_digest.fidelity_features)
         target_fidelities = {
             k: v
             for k, v in search_space_digest.target_values.items()
-            if k in search_space_digest.fidelity_features
+            if k in fidelity_features
         }
         return self.best_point_recommender(  # pyre-ignore [28]
             model=self,
@@ -478,8 +602,19 @@ class BotorchModel(TorchModel):
         if self.refit_on_cv:
             state_dict = None
         else:
-            state_dict = deepcopy(self.model.state_dict())
+            # `state_dict` returns a new dict of detached tensors, so cloning its
+            # values is sufficient and avoids the overhead of `deepcopy`. The
+            # values are replaced in place to keep the `_metadata` attribute used
+            # by `load_state_dict`.
+            state_dict = self.model.state_dict()
+            for k, v in state_dict.items():
+                state_dict[k] = v.clone()
         Xs, Ys, Yvars = _datasets_to_legacy_inputs(datasets=datasets)
+        if self._requested_device is not None:
+            Xs = [X.to(device=self.device) for X in Xs]
+            Ys = [Y.to(device=self.device) for Y in Ys]
+            Yvars = [Yvar.to(device=self.device) for Yvar in Yvars]
+            X_test = X_test.to(device=self.device)
         model = self.model_constructor(  # pyre-ignore: [28]
             Xs=Xs,
             Ys=Ys,
@@ -524,21 +659,179 @@ class BotorchModel(TorchModel):
     @model.setter
     def model(self, model: Model) -> None:
         self._model = model  # there are a few places that set model directly
+        self._traced_predictors = OrderedDict()
+        self._compiled_posterior = None
+
+    def _get_traced_predictor(self, X: Tensor) -> Callable[[Tensor], Any]:
+        """Get `model_predictor` traced for inputs with the shape of `X`.
+
+        Traced predictors are cached by the shape, dtype, and device of the inputs
+        and are discarded whenever the model changes. Only the
+        `MAX_TRACED_PREDICTORS` most recently used predictors are kept.
+        """
+        key = (tuple(X.shape), X.dtype, X.device)
+        predictor = self._traced_predictors.get(key)
+        if predictor is not None:
+            self._traced_predictors.move_to_end(key)
+        else:
+            model = self.model
+
+            def model_predictor(X: Tensor) -> tuple[Tensor, Tensor]:
+                return self.model_predictor(model=model, X=X)  # pyre-ignore [28]
+
+            # Profiling-based optimization of the traced graph adds a warm-up
+            # cost to the first few calls, which isn't worth it for predictions.
+            # `TracerWarning`s are not suppressed, since they are the only sign
+            # that the traced predictor may not generalize to other inputs.
+            with torch.jit.optimized_execution(False), gpytorch.settings.trace_mode():
+                traced = torch.jit.trace(model_predictor, X, check_trace=False)
+
+            def predictor(X: Tensor) -> tuple[Tensor, Tensor]:
+                with torch.jit.optimized_execution(False):
+                    return traced(X)
+
+            self._traced_predictors[key] = predictor
+            if len(self._traced_predictors) > MAX_TRACED_PREDICTORS:
+                self._traced_predictors.popitem(last=False)
+        return predictor
+
+    def _normalize_feature_indices(
+        self, search_space_digest: SearchSpaceDigest, d: int
+    ) -> tuple[list[int], list[int]]:
+        """Normalize the task and fidelity feature indices, reusing the result
+        across `fit` calls with the same features (e.g. during cross-validation).
+        """
+        key = (
+            tuple(search_space_digest.task_features),
+            tuple(search_space_digest.fidelity_features),
+            d,
+        )
+        if self._normalized_indices_cache is None or (
+            self._normalized_indices_cache[0] != key
+        ):
+            normalized_indices = (
+                normalize_indices(search_space_digest.task_features, d=d),
+                normalize_indices(search_space_digest.fidelity_features, d=d),
+            )
+            self._normalized_indices_cache = (key, normalized_indices)
+        return self._normalized_indices_cache[1]
+
+    def _get_bounds_tensor(
+        self, bounds: list[tuple[int | float, int | float]]
+    ) -> Tensor:
+        """Get the `2 x d` tensor of `bounds`, reusing it across `gen` calls."""
+        key = (tuple(map(tuple, bounds)), self.dtype, self.device)
+        if self._bounds_cache is None or self._bounds_cache[0] != key:
+            # `as_tensor` avoids a copy if the bounds are already stored in an
+            # array or tensor of matching dtype and device.
+            bounds_ = torch.as_tensor(bounds, dtype=self.dtype, device=self.device)
+            self._bounds_cache = (key, bounds_.transpose(0, 1))
+        return self._bounds_cache[1]
+
+    def _move_to_device(self, device: torch.device) -> None:
+        """Move the training data and, if fitted, the model to `device`."""
+        # Preserve shared references to the training inputs of multiple outcomes.
+        moved_Xs = {id(X): X.to(device=device) for X in self.Xs}
+        self.Xs = [moved_Xs[id(X)] for X in self.Xs]
+        self.Ys = [Y.to(device=device) for Y in self.Ys]
+        self.Yvars = [Yvar.to(device=device) for Yvar in self.Yvars]
+        if self._model is not None:
+            self._model = self._model.to(device=device)
+        self._traced_predictors = OrderedDict()
+        self.device = device
+
+    def _fall_back_to_cpu(self, stage: str) -> None:
+        """Release cached GPU memory and move the model state to the CPU."""
+        logger.warning(
+            f"Ran out of GPU memory while {stage}, falling back to the CPU."
+        )
+        torch.cuda.empty_cache()
+        self._move_to_device(device=torch.device("cpu"))
+
+
+@contextmanager
+def _override_posterior(
+    model: Model, posterior: Callable[..., Posterior]
+) -> Generator[None, None, None]:
+    """Temporarily replace `model.posterior` with `posterior`.
+
+    The override is only applied for the duration of the context, so that copies
+    of the model (e.g. when fantasizing) never end up with a `posterior` method
+    that is bound to the original model.
+    """
+    model.posterior = posterior  # pyre-ignore [8]
+    try:
+        yield
+    finally:
+        del model.posterior
+
+
+def _torch_opt_config_to_device(
+    torch_opt_config: TorchOptConfig, device: torch.device
+) -> TorchOptConfig:
+    """Move the tensors of a `TorchOptConfig` used by `gen` to `device`."""
+    outcome_constraints = torch_opt_config.outcome_constraints
+    linear_constraints = torch_opt_config.linear_constraints
+    pending_observations = torch_opt_config.pending_observations
+    return dataclasses.replace(
+        torch_opt_config,
+        objective_weights=torch_opt_config.objective_weights.to(device=device),
+        outcome_constraints=(
+            None
+            if outcome_constraints is None
+            else (
+                outcome_constraints[0].to(device=device),
+                outcome_constraints[1].to(device=device),
+            )
+        ),
+        linear_constraints=(
+            None
+            if linear_constraints is None
+            else (
+                linear_constraints[0].to(device=device),
+                linear_constraints[1].to(device=device),
+            )
+        ),
+        pending_observations=(
+            None
+            if pending_observations is None
+            else [X.to(device=device) for X in pending_observations]
+        ),
+    )
 
 
 def get_rounding_func(
     rounding_func: Callable[[Tensor], Tensor] | None,
+    batched: bool = False,
 ) -> Callable[[Tensor], Tensor] | None:
+    """Wrap `rounding_func` so that it can be applied to q- and t-batches.
+
+    Args:
+        rounding_func: A function that rounds an optimization result, or None.
+        batched: If True, `rounding_func` accepts a `N x d` tensor of points and
+            is called once on all points. Otherwise, it is applied to each
+            `d`-dim point separately.
+
+    Returns:
+        A function that rounds a `batch_shape x d` tensor, or None if
+        `rounding_func` is None.
+    """
     if rounding_func is None:
         botorch_rounding_func = rounding_func
     else:
         # make sure rounding_func is properly applied to q- and t-batches
         def botorch_rounding_func(X: Tensor) -> Tensor:
             batch_shape, d = X.shape[:-1], X.shape[-1]
-            X_round = torch.stack(
-                [rounding_func(x) for x in X.view(-1, d)]  # pyre-ignore: [16]
-            )
-            return X_round.view(*batch_shape, d)
+            X_flat = X.reshape(-1, d)
+            if batched:
+                X_round = rounding_func(X_flat)  # pyre-ignore: [16]
+            else:
+                # Write the rounded points into a single preallocated tensor rather
+                # than stacking a list of per-point tensors.
+                X_round = torch.empty_like(X_flat)
+                for i, x in enumerate(X_flat):
+                    X_round[i] = rounding_func(x)  # pyre-ignore: [16]
+            return X_round.reshape(*batch_shape, d)
 
     return botorch_rounding_func
 
@@ -559,36 +852,55 @@ def get_feature_importances_from_botorch_model(
             "Cannot calculate feature_importances without a fitted model."
             "Call `fit` first."
         )
-    elif isinstance(model, ModelList):
-        models = model.models
+    elif not isinstance(model, ModelList):
+        lengthscales = _get_lengthscale(model=model)
+        if is_ensemble(model):  # Take the median over the model batch dimension
+            lengthscales = torch.quantile(lengthscales, q=0.5, dim=0, keepdim=True)
     else:
-        models = [model]
-    lengthscales = []
-    for m in models:
-        try:
-            # this can be a ModelList of a SAAS and STGP, so this is a necessary way
-            # to get the lengthscale
-            if hasattr(m.covar_module, "base_kernel"):
-                ls = m.covar_module.base_kernel.lengthscale
-            else:
-                ls = m.covar_module.lengthscale
-        except AttributeError:
-            ls = None
-        if ls is None or ls.shape[-1] != m.train_inputs[0].shape[-1]:
-            # TODO: We could potentially set the feature importances to NaN in this
-            # case, but this require knowing the batch dimension of this model.
-            # Consider supporting in the future.
-            raise NotImplementedError(
-                "Failed to extract lengthscales from `m.covar_module` "
-                "and `m.covar_module.base_kernel`"
+        lengthscales = [_get_lengthscale(model=m) for m in model.models]
+        ensembles = [is_ensemble(m) for m in model.models]
+        if len({ls.shape for ls in lengthscales}) == 1 and len(set(ensembles)) == 1:
+            # Stack the lengthscales of all models so that the median is computed
+            # for all of them at once rather than per model.
+            lengthscales = torch.stack(lengthscales, dim=0)
+            if ensembles[0]:  # Take the median over the model batch dimension
+                lengthscales = torch.quantile(
+                    lengthscales, q=0.5, dim=1, keepdim=True
+                )
+            lengthscales = lengthscales.flatten(0, 1)
+        else:
+            lengthscales = torch.cat(
+                [
+                    torch.quantile(ls, q=0.5, dim=0, keepdim=True) if ensemble else ls
+                    for ls, ensemble in zip(lengthscales, ensembles)
+                ],
+                dim=0,
             )
-        if ls.ndim == 2:
-            ls = ls.unsqueeze(0)
-        if is_ensemble(m):  # Take the median over the model batch dimension
-            ls = torch.quantile(ls, q=0.5, dim=0, keepdim=True)
-        lengthscales.append(ls)
-    lengthscales = torch.cat(lengthscales, dim=0)
-    feature_importances = (1 / lengthscales).detach().cpu()  # pyre-ignore
+    feature_importances = 1.0 / lengthscales.detach().cpu().numpy()
     # Make sure the sum of feature importances is 1.0 for each metric
-    feature_importances /= feature_importances.sum(dim=-1, keepdim=True)
-    return feature_importances.numpy()
+    feature_importances /= feature_importances.sum(axis=-1, keepdims=True)
+    return feature_importances
+
+
+def _get_lengthscale(model: Model) -> Tensor:
+    """Get the lengthscales of a BoTorch model as a `b x 1 x d`-dim tensor."""
+    try:
+        # this can be a ModelList of a SAAS and STGP, so this is a necessary way
+        # to get the lengthscale
+        if hasattr(model.covar_module, "base_kernel"):
+            ls = model.covar_module.base_kernel.lengthscale
+        else:
+            ls = model.covar_module.lengthscale
+    except AttributeError:
+        ls = None
+    if ls is None or ls.shape[-1] != model.train_inputs[0].shape[-1]:
+        # TODO: We could potentially set the feature importances to NaN in this
+        # case, but this require knowing the batch dimension of this model.
+        # Consider supporting in the future.
+        raise NotImplementedError(
+            "Failed to extract lengthscales from `m.covar_module` "
+            "and `m.covar_module.base_kernel`"
+        )
+    if ls.ndim == 2:
+        ls = ls.unsqueeze(0)
+    return ls
@@ -22,6 +22,7 @@ from botorch.acquisition.objective import ConstrainedMCObjective, GenericMCObjec
 from botorch.acquisition.utils import get_infeasible_cost
 from botorch.exceptions.errors import UnsupportedError
 from botorch.fit import fit_gpytorch_mll
+from botorch.generation.gen import gen_candidates_torch, TGenCandidates
 from botorch.models.gp_regression import SingleTaskGP
 from botorch.models.gp_regression_fidelity import SingleTaskMultiFidelityGP
 from botorch.models.gpytorch import GPyTorchModel
@@ -495,10 +496,88 @@ def scipy_optimizer(
           values, where `i`-th element is the expected acquisition value
           conditional on having observed candidates `0,1,...,i-1`.
     """
+    return _optimize_acqf_with_restarts(
+        acq_function=acq_function,
+        bounds=bounds,
+        n=n,
+        inequality_constraints=inequality_constraints,
+        equality_constraints=equality_constraints,
+        fixed_features=fixed_features,
+        rounding_func=rounding_func,
+        num_restarts=num_restarts,
+        raw_samples=raw_samples,
+        joint_optimization=joint_optimization,
+        options=options,
+        batch_limit=5,
+        gen_candidates=None,
+    )
+
 
+def batched_torch_optimizer(
+    acq_function: AcquisitionFunction,
+    bounds: Tensor,
+    n: int,
+    inequality_constraints: list[tuple[Tensor, Tensor, float]] | None = None,
+    equality_constraints: list[tuple[Tensor, Tensor, float]] | None = None,
+    fixed_features: dict[int, float] | None = None,
+    rounding_func: Callable[[Tensor], Tensor] | None = None,
+    *,
+    num_restarts: int = 20,
+    raw_samples: int | None = None,
+    joint_optimization: bool = False,
+    options: dict[str, bool | float | int | str] | None = None,
+) -> tuple[Tensor, Tensor]:
+    r"""Optimizer that runs all restarts as a single batch of torch optimizers.
+
+    Takes the same arguments and returns the same outputs as `scipy_optimizer`,
+    but evaluates the acquisition function on all `num_restarts` starting
+    points at once in each step, using a `torch.optim.Optimizer` (Adam by
+    default) via `gen_candidates_torch`. `options` may include `maxiter`, `lr`
+    or `optimizer` for `gen_candidates_torch`. Parameter constraints are not
+    supported.
+    """
+    if inequality_constraints is not None or equality_constraints is not None:
+        raise UnsupportedError(
+            "`batched_torch_optimizer` does not support parameter constraints. "
+            "Use `scipy_optimizer` instead."
+        )
+    return _optimize_acqf_with_restarts(
+        acq_function=acq_function,
+        bounds=bounds,
+        n=n,
+        fixed_features=fixed_features,
+        rounding_func=rounding_func,
+        num_restarts=num_restarts,
+        raw_samples=raw_samples,
+        joint_optimization=joint_optimization,
+        options=options,
+        batch_limit=num_restarts,
+        gen_candidates=gen_candidates_torch,
+    )
+
+
+def _optimize_acqf_with_restarts(
+    acq_function: AcquisitionFunction,
+    bounds: Tensor,
+    n: int,
+    num_restarts: int,
+    raw_samples: int | None,
+    joint_optimization: bool,
+    options: dict[str, bool | float | int | str] | None,
+    batch_limit: int,
+    gen_candidates: TGenCandidates | None,
+    inequality_constraints: list[tuple[Tensor, Tensor, float]] | None = None,
+    equality_constraints: list[tuple[Tensor, Tensor, float]] | None = None,
+    fixed_features: dict[int, float] | None = None,
+    rounding_func: Callable[[Tensor], Tensor] | None = None,
+) -> tuple[Tensor, Tensor]:
+    """Optimize `acq_function` with `optimize_acqf`, optimizing `batch_limit`
+    restarts at a time (unless overridden in `options`) with `gen_candidates`
+    (`gen_candidates_scipy` if None).
+    """
     sequential = not joint_optimization
     optimize_acqf_options: dict[str, bool | float | int | str] = {
-        "batch_limit": 5,
+        "batch_limit": batch_limit,
         "init_batch_limit": 32,
     }
     if options is not None:
@@ -515,6 +594,7 @@ def scipy_optimizer(
         fixed_features=fixed_features,
         sequential=sequential,
         post_processing_func=rounding_func,
+        gen_candidates=gen_candidates,
     )
     return X, expected_acquisition_value
 
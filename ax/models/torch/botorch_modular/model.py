@@ -251,7 +251,10 @@ class BoTorchModel(TorchModel, Base):
             torch_opt_config=torch_opt_config,
             acq_options=acq_options,
         )
-        botorch_rounding_func = get_rounding_func(torch_opt_config.rounding_func)
+        botorch_rounding_func = get_rounding_func(
+            rounding_func=torch_opt_config.rounding_func,
+            batched=torch_opt_config.batched_rounding_func,
+        )
         candidates, expected_acquisition_value, weights = acqf.optimize(
             n=n,
             search_space_digest=search_space_digest,
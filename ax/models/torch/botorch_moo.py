@@ -12,7 +12,7 @@ from typing import Any, Optional
 
 import torch
 from ax.core.search_space import SearchSpaceDigest
-from ax.exceptions.core import AxError
+from ax.exceptions.core import AxError, UnsupportedError
 from ax.models.torch.botorch import (
     BotorchModel,
     get_rounding_func,
@@ -66,6 +66,9 @@ TOptimizerList = Callable[
     tuple[Tensor, Tensor],
 ]
 
+# `BotorchModel` arguments that `MultiObjectiveBotorchModel` does not support.
+_UNSUPPORTED_KWARGS = ("device", "use_jit", "use_torch_compile", "aggressive_gc")
+
 
 class MultiObjectiveBotorchModel(BotorchModel):
     r"""
@@ -213,6 +216,14 @@ class MultiObjectiveBotorchModel(BotorchModel):
         prior: dict[str, Any] | None = None,
         **kwargs: Any,
     ) -> None:
+        # These `BotorchModel` options are not implemented for the multi-objective
+        # model; reject them rather than passing them on to `model_constructor`.
+        unsupported_kwargs = [k for k in _UNSUPPORTED_KWARGS if k in kwargs]
+        if len(unsupported_kwargs) > 0:
+            raise UnsupportedError(
+                f"{self.__class__.__name__} does not support the arguments "
+                f"{unsupported_kwargs}."
+            )
         self.model_constructor = model_constructor
         self.model_predictor = model_predictor
         self.acqf_constructor = acqf_constructor
@@ -298,7 +309,10 @@ class MultiObjectiveBotorchModel(BotorchModel):
             search_space_digest.bounds, dtype=self.dtype, device=self.device
         )
         bounds_ = bounds_.transpose(0, 1)
-        botorch_rounding_func = get_rounding_func(torch_opt_config.rounding_func)
+        botorch_rounding_func = get_rounding_func(
+            rounding_func=torch_opt_config.rounding_func,
+            batched=torch_opt_config.batched_rounding_func,
+        )
         if acf_options.pop("random_scalarization", False) or acf_options.get(
             "chebyshev_scalarization", False
         ):
@@ -73,6 +73,9 @@ class TorchOptConfig:
             >>> }
         rounding_func: A function that rounds an optimization result
             appropriately (i.e., according to `round-trip` transformations).
+            By default, this is applied to each `d`-dim point separately.
+        batched_rounding_func: If True, `rounding_func` accepts a `N x d` tensor
+            of points and is applied to all points at once.
         opt_config_metrics: A dictionary of metrics that are included in
             the optimization config.
         is_moo: A boolean denoting whether this is for an MOO problem.
@@ -87,6 +90,7 @@ class TorchOptConfig:
     pending_observations: list[Tensor] | None = None
     model_gen_options: TConfig = field(default_factory=dict)
     rounding_func: Callable[[Tensor], Tensor] | None = None
+    batched_rounding_func: bool = False
     opt_config_metrics: dict[str, Metric] = field(default_factory=dict)
     is_moo: bool = False
     risk_measure: RiskMeasureMCObjective | None = None